@@ -0,0 +1,55 @@
+from django.core.cache import cache
+
+from rest_framework.response import Response
+
+LIST_CACHE_TIMEOUT = 60 * 15
+
+
+def _get_version_key(model) -> str:
+    return f'list-cache-version:{model._meta.label_lower}'
+
+
+def invalidate_list_cache(model):
+    """Сбрасывает закэшированные списки объектов модели.
+
+    Кэш не удаляется явно: увеличивается номер версии модели, и старые
+    ключи перестают использоваться до истечения их таймаута.
+
+    Args:
+        model: класс модели, списки которой устарели.
+
+    """
+    key = _get_version_key(model)
+
+    try:
+        cache.incr(key)
+
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+class CachedListMixin:
+    """Миксин вьюсета, кэширующий ответы list-запросов.
+
+    Ключ кэша строится по полному пути запроса с параметрами фильтрации
+    и пагинации и по версии модели вьюсета, которая увеличивается при
+    изменении данных (см. api.signals).
+
+    """
+    list_cache_timeout = LIST_CACHE_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        model = self.get_queryset().model
+        version = cache.get_or_set(_get_version_key(model), 1, None)
+        key = (f'list-cache:{model._meta.label_lower}:{version}:'
+               f'{request.get_full_path()}')
+
+        data = cache.get(key)
+
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, self.list_cache_timeout)
+
+        return response
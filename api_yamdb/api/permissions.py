@@ -1,11 +1,14 @@
 from rest_framework.exceptions import MethodNotAllowed
 from rest_framework.permissions import BasePermission
 
+FREE_ACTIONS = frozenset(
+    ('retrieve', 'list', 'partial_update', 'destroy', 'update')
+)
+
 
 class ReviewViewSetPermission(BasePermission):
     def has_permission(self, request, view):
-        if view.action in ['retrieve', 'list', 'partial_update', 'destroy',
-                           'update']:
+        if view.action in FREE_ACTIONS:
             return True
 
         if view.action == 'create':
@@ -14,15 +17,17 @@ class ReviewViewSetPermission(BasePermission):
         if request.method == 'PUT':
             raise MethodNotAllowed(request.method)
 
+        return False
+
     def has_object_permission(self, request, view, obj):
         if view.action == 'retrieve':
             return True
 
+        user = request.user
+
         return (
-            request.user.is_authenticated
-            and (request.user.is_staff
-                 or request.user.is_moderator
-                 or request.user == obj.author)
+            user.is_authenticated
+            and (user.is_privileged or user == obj.author)
         )
 
 
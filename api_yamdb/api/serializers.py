@@ -1,13 +1,13 @@
+import re
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db.models import Avg
-from django.shortcuts import get_object_or_404
+from django.db.models import Q
 from django.utils import timezone
 
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError, NotFound
-from rest_framework.validators import UniqueValidator
 
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
@@ -21,6 +21,8 @@ from reviews.models import (
 
 User = get_user_model()
 
+USERNAME_RE = re.compile(r'^[\w.@+-]+$')
+
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """Кастомный сериализатор для получения jwt-токена.
@@ -35,7 +37,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         # поле username.
         self.fields[self.username_field] = serializers.RegexField(
-            regex=r'^[\w.@+-]+$',
+            regex=USERNAME_RE,
             max_length=150,
         )
 
@@ -59,7 +61,10 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
 
         """
         try:
-            self.user_obj = User.objects.get(username=attrs['username'])
+            # для проверки кода и выпуска токена достаточно этих полей.
+            self.user_obj = User.objects.only(
+                'id', 'password', 'last_login'
+            ).get(username=attrs['username'])
 
         except User.DoesNotExist as e:
             raise NotFound('Пользователь не найден.') from e
@@ -93,14 +98,8 @@ class UserSerializer(serializers.ModelSerializer):
 
     """
     username = serializers.RegexField(
-        regex=r'^[\w.@+-]+$',
+        regex=USERNAME_RE,
         max_length=150,
-        validators=(
-            UniqueValidator(
-                queryset=User.objects.all(),
-                message='Данное имя пользователя уже занято.'
-            ),
-        ),
     )
     email = serializers.EmailField(max_length=254)
     first_name = serializers.CharField(required=False, max_length=150)
@@ -129,13 +128,39 @@ class UserSerializer(serializers.ModelSerializer):
 
         return value
 
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise ValidationError(
-                'Пользователь с таким email уже существует.'
-            )
+    def validate(self, attrs):
+        """Проверяет уникальность username и email одним запросом к БД.
 
-        return value
+        Raises:
+            ValidationError: если username или email уже заняты другим
+                пользователем.
+
+        """
+        username = attrs.get('username')
+        email = attrs.get('email')
+
+        if username is None and email is None:
+            return attrs
+
+        users = User.objects.filter(Q(username=username) | Q(email=email))
+
+        if self.instance is not None:
+            users = users.exclude(pk=self.instance.pk)
+
+        errors = {}
+
+        for taken_username, taken_email in users.values_list(
+                'username', 'email'):
+            if username is not None and taken_username == username:
+                errors['username'] = 'Данное имя пользователя уже занято.'
+
+            if email is not None and taken_email == email:
+                errors['email'] = 'Пользователь с таким email уже существует.'
+
+        if errors:
+            raise ValidationError(errors)
+
+        return attrs
 
 
 class SignUpNewUserSerializer(UserSerializer):
@@ -150,23 +175,45 @@ class SignUpExistingUserSerializer(SignUpNewUserSerializer):
     """Сериализатор для работы с существующими пользователями.
 
     """
-    username = serializers.RegexField(regex=r'^[\w.@+-]+$', max_length=150)
+    username = serializers.RegexField(regex=USERNAME_RE, max_length=150)
 
-    def validate_email(self, value):
-        if not User.objects.filter(email=value).exists():
-            raise ValidationError(
-                'Пользователь с таким email не существует.'
-            )
+    def validate(self, attrs):
+        """Проверяет существование username и email одним запросом к БД.
 
-        return value
+        Raises:
+            ValidationError: если пользователь с таким username или email
+                не найден.
 
-    def validate_username(self, value):
-        if not User.objects.filter(username=value).exists():
-            raise ValidationError(
-                'Пользователь не найден.'
-            )
+        """
+        username = attrs.get('username')
+        email = attrs.get('email')
+
+        if username is None and email is None:
+            return attrs
+
+        found = User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values_list('username', 'email')
+
+        found_usernames = set()
+        found_emails = set()
+
+        for found_username, found_email in found:
+            found_usernames.add(found_username)
+            found_emails.add(found_email)
 
-        return super().validate_username(value)
+        errors = {}
+
+        if email is not None and email not in found_emails:
+            errors['email'] = 'Пользователь с таким email не существует.'
+
+        if username is not None and username not in found_usernames:
+            errors['username'] = 'Пользователь не найден.'
+
+        if errors:
+            raise ValidationError(errors)
+
+        return attrs
 
 
 class GetSelfDataSerializer(UserSerializer):
@@ -194,22 +241,38 @@ class PatchSelfDataSerializer(SignUpExistingUserSerializer):
         )
 
 
-class CategorySerializer(serializers.ModelSerializer):
-    """Сериализатор модели категории.
+class NameSlugSerializer(serializers.ModelSerializer):
+    """Базовый сериализатор моделей с полями name и slug.
 
     """
     class Meta:
-        model = Category
         fields = ('name', 'slug')
 
+    def to_representation(self, instance):
+        """Сериализует объект без обхода полей DRF.
+
+        Сериализатор вложен в TitleSerializer и вызывается для каждого
+        произведения в списке, поэтому поля из Meta.fields читаются
+        напрямую.
 
-class GenreSerializer(serializers.ModelSerializer):
+        """
+        return {field: getattr(instance, field) for field in self.Meta.fields}
+
+
+class CategorySerializer(NameSlugSerializer):
+    """Сериализатор модели категории.
+
+    """
+    class Meta(NameSlugSerializer.Meta):
+        model = Category
+
+
+class GenreSerializer(NameSlugSerializer):
     """Сериализатор модели жанра.
 
     """
-    class Meta:
+    class Meta(NameSlugSerializer.Meta):
         model = Genre
-        fields = ('name', 'slug',)
 
 
 class TitleSerializer(serializers.ModelSerializer):
@@ -235,8 +298,11 @@ class TitleSerializer(serializers.ModelSerializer):
     def get_rating(self, obj) -> int:
         """Возвращает значение рейтинга произведения как среднее всех обзоров.
 
+        Среднее значение хранится в поле rating произведения и
+        пересчитывается при изменении отзывов.
+
         """
-        rating = obj.reviews.aggregate(Avg('score')).get('score__avg')
+        rating = obj.rating
 
         if not rating:
             return rating
@@ -257,10 +323,17 @@ class TitleCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Title
-        fields = '__all__'
+        fields = (
+            'id',
+            'name',
+            'description',
+            'year',
+            'genre',
+            'category',
+        )
 
     def validate_year(self, value) -> int:
-        if not 0 <= value <= timezone.now().year:
+        if value is not None and not 0 <= value <= timezone.now().year:
             raise serializers.ValidationError(
                 'Год создания должен быть между 0 и текущим годом.'
             )
@@ -274,6 +347,9 @@ class ReviewSerializer(serializers.ModelSerializer):
     """
     MIN_LIMIT_VALUE = 1
     MAX_LIMIT_VALUE = 10
+    DUPLICATE_REVIEW_MESSAGE = (
+        'К одному произведению можно оставить один отзыв.'
+    )
 
     author = serializers.SlugRelatedField(
         read_only=True, slug_field='username'
@@ -298,14 +374,9 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     def validate(self, data):
         if self.context['request'].method == 'POST':
-            user = self.context['request'].user
-            title_id = self.context['view'].kwargs.get('title_id')
-            title = get_object_or_404(Title, pk=title_id)
-
-            if title.reviews.filter(author=user):
-                raise ValidationError(
-                    'К одному произведению можно оставить один отзыв.'
-                )
+            # флаг аннотирован вьюсетом при получении произведения.
+            if self.context['title'].already_reviewed:
+                raise ValidationError(self.DUPLICATE_REVIEW_MESSAGE)
 
         return data
 
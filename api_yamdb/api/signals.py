@@ -0,0 +1,49 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.mixins import invalidate_list_cache
+
+from reviews.models import Category, Genre, Review, Title, TitleGenre
+# обработчики reviews (пересчет рейтинга) подключаются раньше здешних,
+# чтобы кэш сбрасывался уже после обновления данных.
+import reviews.signals  # noqa: F401
+
+# модели, изменение которых влияет на закэшированные списки.
+DEPENDENT_LISTS = {
+    Category: (Category, Title),
+    Genre: (Genre, Title),
+    Title: (Title,),
+    TitleGenre: (Title,),
+    Review: (Title,),
+}
+
+
+def _invalidate_on_commit(model):
+    """Сбрасывает кэш списков модели после фиксации транзакции.
+
+    Иначе запрос, пришедший до фиксации, закэширует старые данные
+    под новой версией.
+
+    """
+    transaction.on_commit(partial(invalidate_list_cache, model))
+
+
+def invalidate_dependent_lists(sender, **kwargs):
+    for model in DEPENDENT_LISTS[sender]:
+        _invalidate_on_commit(model)
+
+
+# подключаем обработчик только к нужным моделям: получатель без sender
+# отключает быстрое каскадное удаление для всех моделей проекта.
+for model in DEPENDENT_LISTS:
+    post_save.connect(invalidate_dependent_lists, sender=model)
+    post_delete.connect(invalidate_dependent_lists, sender=model)
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_title_genres(sender, action, **kwargs):
+    if action.startswith('post_'):
+        _invalidate_on_commit(Title)
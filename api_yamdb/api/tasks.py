@@ -0,0 +1,29 @@
+from celery import shared_task
+from django.core.mail import send_mail
+
+from api_yamdb.settings import DEFAULT_FROM_EMAIL
+
+
+@shared_task
+def send_confirmation_email(username, email, confirmation_code):
+    """Отправляет письмо с кодом подтверждения.
+
+    Выполняется воркером celery, чтобы ожидание почтового сервера
+    не задерживало ответ на запрос регистрации.
+
+    Args:
+        username: имя пользователя.
+        email: адрес получателя.
+        confirmation_code: код подтверждения.
+
+    """
+    subject = 'Email Confirmation'
+    body = (f'Код подтверждения для пользователя {username}: '
+            f'{confirmation_code}')
+
+    send_mail(
+        subject=subject,
+        message=body,
+        from_email=DEFAULT_FROM_EMAIL,
+        recipient_list=(email,),
+    )
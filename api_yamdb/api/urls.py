@@ -47,16 +47,6 @@ router_v1.register(
     CommentViewSet,
     basename='comment'
 )
-router_v1.register(
-    r'titles/(?P<title_id>\d+)/reviews',
-    ReviewViewSet,
-    basename=r'reviews'
-)
-router_v1.register(
-    r'titles/(?P<title_id>\d+)/reviews/(?P<review_id>\d+)/comments',
-    CommentViewSet,
-    basename=r'comments',
-)
 
 urlpatterns = [
     path('v1/', include(router_v1.urls)),
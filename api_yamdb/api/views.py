@@ -1,23 +1,26 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef
 from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import SearchFilter
 from rest_framework.generics import CreateAPIView
 from rest_framework.permissions import AllowAny, IsAuthenticated, SAFE_METHODS
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.viewsets import ModelViewSet
 
 from rest_framework_simplejwt.views import TokenObtainPairView
 
 from django_filters import rest_framework as filters
 
-from api_yamdb.settings import DEFAULT_FROM_EMAIL
-
 from api.filters import TitleFilterSet
+from api.mixins import CachedListMixin
 from api.permissions import (
     CommentViewSetPermission,
     ReviewViewSetPermission,
@@ -36,6 +39,7 @@ from api.serializers import (
     TitleSerializer,
     UserSerializer,
 )
+from api.tasks import send_confirmation_email
 
 from reviews.models import Category, Genre, Review, Title
 
@@ -84,8 +88,13 @@ class UsersViewSet(ModelViewSet):
 class SignUpAPIView(CreateAPIView):
     """Вью-класс отправки письма с кодом подтверждения.
 
+    Attributes:
+        user_obj: объект существующего пользователя, найденный при выборе
+            сериализатора, либо None.
+
     """
     permission_classes = (AllowAny,)
+    user_obj = None
 
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -93,54 +102,41 @@ class SignUpAPIView(CreateAPIView):
         if serializer.is_valid():
 
             if isinstance(serializer, SignUpExistingUserSerializer):
-                user = User.objects.get(
-                    username=serializer.validated_data['username']
-                )
                 confirmation_code = default_token_generator.make_token(
-                    user=user
+                    user=self.user_obj
+                )
+                send_confirmation_email.delay(
+                    self.user_obj.username,
+                    self.user_obj.email,
+                    confirmation_code,
                 )
-                self._send_msg(user, confirmation_code)
                 return Response(serializer.data, status.HTTP_200_OK)
 
             serializer.save()
             confirmation_code = default_token_generator.make_token(
                 user=serializer.instance
             )
-            self._send_msg(serializer.instance, confirmation_code)
+            send_confirmation_email.delay(
+                serializer.instance.username,
+                serializer.instance.email,
+                confirmation_code,
+            )
             return Response(serializer.data, status.HTTP_200_OK)
 
         return Response(serializer.errors, status.HTTP_400_BAD_REQUEST)
 
     def get_serializer_class(self):
-        try:
-            User.objects.get(username=self.request.data.get('username'))
+        self.user_obj = User.objects.filter(
+            username=self.request.data.get('username')
+        ).first()
 
-        except User.DoesNotExist:
+        if self.user_obj is None:
             return SignUpNewUserSerializer
 
         return SignUpExistingUserSerializer
 
-    def _send_msg(self, user, confirmation_code):
-        """Вспомогательный метод для отправки письма с виртуального сервера.
 
-        Args:
-            user: объект пользователя.
-            confirmation_code: код подтверждения.
-
-        """
-        subject = 'Email Confirmation'
-        body = (f'Код подтверждения для пользователя {user.username}: '
-                f'{confirmation_code}')
-
-        send_mail(
-            subject=subject,
-            message=body,
-            from_email=DEFAULT_FROM_EMAIL,
-            recipient_list=(user.email,),
-        )
-
-
-class GenreViewSet(ModelViewSet):
+class GenreViewSet(CachedListMixin, ModelViewSet):
     """Вьюсет жанров.
 
     """
@@ -168,7 +164,7 @@ class GenreViewSet(ModelViewSet):
         return super().get_permissions()
 
 
-class CategoryViewSet(ModelViewSet):
+class CategoryViewSet(CachedListMixin, ModelViewSet):
     """Вьюсет категорий.
 
     """
@@ -196,11 +192,11 @@ class CategoryViewSet(ModelViewSet):
         return super().get_permissions()
 
 
-class TitleViewSet(ModelViewSet):
+class TitleViewSet(CachedListMixin, ModelViewSet):
     """Вьюсет произведений.
 
     """
-    queryset = Title.objects.all()
+    queryset = Title.objects.with_genres()
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = TitleFilterSet
 
@@ -223,19 +219,56 @@ class ReviewViewSet(ModelViewSet):
     serializer_class = ReviewSerializer
     permission_classes = (ReviewViewSetPermission,)
 
+    @cached_property
+    def _title(self):
+        """Произведение из URL, запрашивается один раз за запрос.
+
+        При создании отзыва тем же запросом проверяется, оставлял ли
+        пользователь отзыв на это произведение (already_reviewed).
+
+        """
+        titles = Title.objects.only('id')
+
+        if self.action == 'create':
+            titles = titles.annotate(already_reviewed=Exists(
+                Review.objects.filter(
+                    title=OuterRef('pk'),
+                    author=self.request.user
+                )
+            ))
+
+        return get_object_or_404(titles, id=self.kwargs.get('title_id'))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['title'] = self._title
+        return context
+
     def get_queryset(self):
-        title = get_object_or_404(
-            Title,
-            id=self.kwargs.get('title_id')
+        return self._title.reviews.select_related('author').order_by(
+            '-pub_date'
         )
-        return title.reviews.all()
 
     def perform_create(self, serializer):
-        title = get_object_or_404(
-            Title,
-            id=self.kwargs.get('title_id')
-        )
-        serializer.save(author=self.request.user, title=title)
+        # проверка в сериализаторе не защищает от параллельных запросов,
+        # окончательно дубликат отсекает constraint unique_author_title.
+        try:
+            with transaction.atomic():
+                serializer.save(author=self.request.user, title=self._title)
+
+        except IntegrityError as e:
+            # прочие нарушения целостности (например, произведение
+            # удалено до вставки) не выдаются за повторный отзыв.
+            if not Review.objects.filter(
+                title=self._title, author=self.request.user
+            ).exists():
+                raise
+
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    ReviewSerializer.DUPLICATE_REVIEW_MESSAGE
+                ]
+            }) from e
 
 
 class CommentViewSet(ModelViewSet):
@@ -245,16 +278,18 @@ class CommentViewSet(ModelViewSet):
     serializer_class = CommentSerializer
     permission_classes = (CommentViewSetPermission,)
 
-    def get_queryset(self):
-        review = get_object_or_404(
-            Review,
+    @cached_property
+    def _review(self):
+        """Отзыв из URL, запрашивается один раз за запрос."""
+        return get_object_or_404(
+            Review.objects.only('id'),
             id=self.kwargs.get('review_id')
         )
-        return review.comments.all()
 
-    def perform_create(self, serializer):
-        review = get_object_or_404(
-            Review,
-            id=self.kwargs.get('review_id')
+    def get_queryset(self):
+        return self._review.comments.select_related('author').order_by(
+            '-pub_date'
         )
-        serializer.save(author=self.request.user, review=review)
+
+    def perform_create(self, serializer):
+        serializer.save(author=self.request.user, review=self._review)
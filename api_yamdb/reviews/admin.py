@@ -46,6 +46,7 @@ class UserAdmin(admin.ModelAdmin):
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ('pk', 'text', 'score', 'title', 'author', 'pub_date', )
+    list_select_related = ('title', 'author', )
     search_fields = ('text', 'author', )
     list_filter = ('pub_date', 'score', 'author', 'title', )
 
@@ -53,5 +54,6 @@ class ReviewAdmin(admin.ModelAdmin):
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('pk', 'text', 'review', 'author', 'pub_date', )
+    list_select_related = ('review', 'author', )
     search_fields = ('text', 'author', )
     list_filter = ('pub_date', 'author', )
@@ -2,5 +2,8 @@ from django.apps import AppConfig
 
 
 class ReviewsConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
+    default_auto_field = 'django.db.models.AutoField'
     name = 'reviews'
+
+    def ready(self):
+        import reviews.signals  # noqa: F401
@@ -1,16 +1,20 @@
 import csv
 import os
+from itertools import islice
 from pathlib import Path
 from typing import List
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 from django.db.models import Model
 from reviews.models import (Category, Comment, Genre, Review, Title,
                             TitleGenre, User)
 
 CSV_DATA_PATH = os.path.join(settings.STATICFILES_DIRS[0], 'data')
 
+BATCH_SIZE = 1000
+
 MODELS = {
     'category': Category,
     'genre': Genre,
@@ -123,54 +127,73 @@ class Command(BaseCommand):
         csv_to_models = dict(zip(target_models, source_files))
 
         print('Models and source files are parsed. Started extracting')
-        for model, source in csv_to_models.items():
-            with open(source, 'r', encoding='utf-8') as csv_file:
-                try:
-                    reader = csv.DictReader(csv_file)
-                    objects = []
-
-                    for row in reader:
-                        row = self._update_foreign_values(row)
-                        objects.append(row)
-
-                    model.objects.bulk_create(
-                        model(**data)
-                        for data in objects
-                    )
-                except Exception as e:
-                    raise CommandError(f'Error while populating {model}: {e}')
+        with transaction.atomic():
+            for model, source in csv_to_models.items():
+                self._populate_model(model, source)
+
+            # bulk_create не отправляет сигналы, поэтому рейтинг
+            # произведений пересчитывается отдельно.
+            if Review in csv_to_models:
+                Title.recompute_rating(Title.objects.values('pk'))
 
         self.stdout.write(self.style.SUCCESS('DB successfully populated'))
 
-    def _update_foreign_values(self, record):
-        """Заменяет внешний ключ в записи на сам объект,
-        на который он ссылается.
+    def _populate_model(self, model: Model, source: Path):
+        """Заполняет таблицу модели записями из csv-файла.
 
-        Заменяет значения внешних ключей в словаре на сами инстансы модели.
-        "id" = 1 -> "id" = model.objects.get(pk=1)
-        Для дальнейшней передачи в create() или bulk_create().
+        Записи вставляются пачками по BATCH_SIZE.
 
         Args:
-            record: Словарь, представляющий собой запись из таблицы
-        Returns:
-            Словарь с подставленными вместо внешних ключей объектами
+            model: класс заполняемой модели.
+            source: путь к csv-файлу.
         Raises:
-            CommandError: Объект с таким внешним ключем не был найден.
+            CommandError: Ошибка при вставке записей.
         """
-        for field, value in record.items():
-            if field in FOREIGN_KEYS:
-                foreign_key_model = FOREIGN_KEYS[field]
+        with open(source, 'r', encoding='utf-8') as csv_file:
+            try:
+                reader = csv.reader(csv_file)
+                fields = self._get_field_names(next(reader, []))
+                objects = (
+                    model(**dict(zip(fields, row)))
+                    for row in reader
+                )
 
-                record[field] = foreign_key_model.objects.get(
-                    pk=value
+                # bulk_create целиком загружает переданный iterable
+                # в память, поэтому файл нарезается на пачки вручную.
+                while True:
+                    batch = list(islice(objects, BATCH_SIZE))
+                    if not batch:
+                        break
+                    model.objects.bulk_create(batch)
+
+                # внешние ключи проверяются БД только при фиксации
+                # транзакции, поэтому битые ссылки ищутся сразу, пока
+                # ошибку можно связать с моделью.
+                connection.check_constraints(
+                    table_names=[model._meta.db_table]
                 )
-                if record[field] is None:
-                    raise CommandError(
-                        f'''Foreign key constraint мiolation:
-                        no record ащк pk={value}
-                        '''
-                    )
-        return record
+            except Exception as e:
+                raise CommandError(f'Error while populating {model}: {e}')
+
+    def _get_field_names(self, header: List[str]) -> List[str]:
+        """Заменяет внешние ключи в заголовке csv-файла на поля их id.
+
+        Значения внешних ключей присваиваются напрямую столбцу id
+        связанной записи:
+        "author" -> "author_id"
+        Для дальнейшней передачи в bulk_create() без запросов к БД
+        за связанными объектами. Целостность ссылок
+        проверяется constraint'ами внешних ключей в самой БД.
+
+        Args:
+            header: Список названий столбцов из первой строки файла
+        Returns:
+            Список названий полей модели в порядке столбцов
+        """
+        return [
+            f'{field}_id' if field in FOREIGN_KEYS else field
+            for field in header
+        ]
 
     def _validate_source_kwarg(self, sources: List[str]) -> List[Path]:
         """Проверяет валидность введенных путей к csv-файлам
@@ -0,0 +1,32 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:05
+
+from django.db import migrations, models
+
+
+def fill_rating(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    Title = apps.get_model('reviews', 'Title')
+
+    average_score = Review.objects.filter(
+        title=models.OuterRef('pk')
+    ).values('title').annotate(
+        average=models.Avg('score')
+    ).values('average')
+
+    Title.objects.update(rating=models.Subquery(average_score))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_drop_name_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(editable=False, null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.RunPython(fill_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0006_titlegenre_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='text',
+            field=models.CharField(max_length=200, verbose_name='Текст комментария'),
+        ),
+    ]
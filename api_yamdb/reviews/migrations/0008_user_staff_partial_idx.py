@@ -0,0 +1,17 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_comment_text_char'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(_negated=True, role='user'), fields=['role'], name='user_staff_partial_idx'),
+        ),
+    ]
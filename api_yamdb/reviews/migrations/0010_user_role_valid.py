@@ -0,0 +1,17 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0009_drop_slug_regex_validators'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(check=models.Q(role__in=('admin', 'moderator', 'user')), name='user_role_valid'),
+        ),
+    ]
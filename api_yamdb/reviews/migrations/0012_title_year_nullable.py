@@ -0,0 +1,30 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:08
+
+from django.db import migrations, models
+import reviews.validators
+
+
+def clear_year_sentinel(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Title.objects.filter(year=0).update(year=None)
+
+
+def restore_year_sentinel(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Title.objects.filter(year__isnull=True).update(year=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0011_title_cat_name_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='title',
+            name='year',
+            field=models.PositiveSmallIntegerField(blank=True, null=True, validators=[reviews.validators.title_year_validator], verbose_name='Год написания'),
+        ),
+        migrations.RunPython(clear_year_sentinel, restore_year_sentinel),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.16 on 2026-10-15 20:08
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0014_pub_date_default'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='title',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='title_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -1,7 +1,8 @@
 from django.contrib.auth.models import AbstractUser
-from django.core.validators import (MaxValueValidator, MinValueValidator,
-                                    RegexValidator)
+from django.contrib.postgres.indexes import GinIndex
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 from reviews.validators import title_year_validator
 
@@ -34,10 +35,23 @@ class User(AbstractUser):
     class Meta:
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+        indexes = (
+            models.Index(fields=['email'], name='user_email_idx'),
+            # индексируются только привилегированные пользователи.
+            models.Index(
+                fields=['role'],
+                condition=~models.Q(role='user'),
+                name='user_staff_partial_idx'
+            ),
+        )
+        constraints = (
+            models.CheckConstraint(
+                check=models.Q(role__in=('admin', 'moderator', 'user')),
+                name='user_role_valid'
+            ),
+        )
 
     def save(self, *args, **kwargs):
-        User._meta.get_field('username').db_index = True
-
         if self.role == self.ADMIN:
             self.is_staff = True
 
@@ -47,10 +61,27 @@ class User(AbstractUser):
     def is_moderator(self):
         return self.role == self.MODERATOR
 
+    @property
+    def is_privileged(self):
+        """Может ли пользователь изменять чужой контент."""
+        return self.is_staff or self.is_moderator
+
     def __str__(self) -> str:
         return f'{self.username} [{self.role}]'
 
 
+class TitleQuerySet(models.QuerySet):
+
+    def with_genres(self):
+        """Подгружает категорию и жанры без отдельных запросов на объект.
+
+        Категория присоединяется join'ом, жанры всех произведений выборки
+        загружаются одним дополнительным запросом.
+
+        """
+        return self.select_related('category').prefetch_related('genre')
+
+
 class Title(models.Model):
     """Модель представления произведения.
 
@@ -66,7 +97,8 @@ class Title(models.Model):
     )
     year = models.PositiveSmallIntegerField(
         'Год написания',
-        default=0,
+        null=True,
+        blank=True,
         validators=[
             title_year_validator
         ]
@@ -82,16 +114,56 @@ class Title(models.Model):
         null=True,
         on_delete=models.SET_NULL,
         verbose_name='Категория',
+        db_index=False,
     )
+    rating = models.FloatField(
+        'Рейтинг',
+        null=True,
+        editable=False,
+    )
+
+    objects = TitleQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'Произведение'
         verbose_name_plural = 'Произведения'
         default_related_name = 'titles'
+        # индекс также обслуживает выборки по category вместо
+        # отдельного индекса внешнего ключа.
+        indexes = (
+            models.Index(
+                fields=['category', 'name'],
+                name='title_cat_name_idx'
+            ),
+            # триграммный индекс для фильтра по подстроке в названии.
+            GinIndex(
+                fields=['name'],
+                name='title_name_trgm',
+                opclasses=['gin_trgm_ops']
+            ),
+        )
 
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def recompute_rating(cls, pks):
+        """Пересчитывает рейтинг произведений одним UPDATE-запросом.
+
+        Args:
+            pks: первичные ключи произведений (список или queryset).
+
+        """
+        average_score = Review.objects.filter(
+            title=models.OuterRef('pk')
+        ).values('title').annotate(
+            average=models.Avg('score')
+        ).values('average')
+
+        cls.objects.filter(pk__in=pks).update(
+            rating=models.Subquery(average_score)
+        )
+
 
 class Category(models.Model):
     """Модель представления категории.
@@ -100,15 +172,11 @@ class Category(models.Model):
     name = models.CharField(
         'Название',
         max_length=256,
-        db_index=True,
     )
     slug = models.SlugField(
         'Слаг',
         max_length=50,
         unique=True,
-        validators=[
-            RegexValidator(r'^[-a-zA-Z0-9_]+$')
-        ]
     )
 
     class Meta:
@@ -126,14 +194,10 @@ class Genre(models.Model):
     name = models.CharField(
         'Название',
         max_length=256,
-        db_index=True,
     )
     slug = models.SlugField(
         'Слаг',
         max_length=50,
-        validators=[
-            RegexValidator(r'^[-a-zA-Z0-9_]+$')
-        ],
         unique=True
     )
 
@@ -146,15 +210,20 @@ class Genre(models.Model):
 
 
 class TitleGenre(models.Model):
+    # отдельные индексы по внешним ключам не нужны: выборки по title
+    # обслуживает уникальный constraint, выборки по genre - индекс
+    # (genre, title).
     title = models.ForeignKey(
         'Title',
         verbose_name='Произведение',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
     genre = models.ForeignKey(
         'Genre',
         verbose_name='Жанр',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
 
     class Meta:
@@ -165,6 +234,12 @@ class TitleGenre(models.Model):
                 name='unique_title_AK'
             ),
         ]
+        indexes = [
+            models.Index(
+                fields=['genre', 'title'],
+                name='titlegenre_genre_title_idx'
+            ),
+        ]
 
 
 class Review(models.Model):
@@ -174,7 +249,8 @@ class Review(models.Model):
     title = models.ForeignKey(
         'Title',
         verbose_name='Произведение',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
     text = models.CharField(
         verbose_name='Текст отзыва',
@@ -183,10 +259,12 @@ class Review(models.Model):
     author = models.ForeignKey(
         'User',
         verbose_name='Автор',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
     pub_date = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         verbose_name='Дата публикации'
     )
     score = models.PositiveSmallIntegerField(
@@ -207,6 +285,16 @@ class Review(models.Model):
                 name='unique_author_title'
             ),
         )
+        indexes = (
+            models.Index(
+                fields=['title', '-pub_date'],
+                name='review_title_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='review_author_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text
@@ -219,18 +307,22 @@ class Comment(models.Model):
     review = models.ForeignKey(
         'Review',
         verbose_name='Отзыв',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
-    text = models.TextField(
+    text = models.CharField(
+        verbose_name='Текст комментария',
         max_length=200
     )
     author = models.ForeignKey(
         'User',
         verbose_name='Автор',
-        on_delete=models.CASCADE
+        on_delete=models.CASCADE,
+        db_index=False,
     )
     pub_date = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         verbose_name='Дата публикации'
     )
 
@@ -238,6 +330,16 @@ class Comment(models.Model):
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        indexes = (
+            models.Index(
+                fields=['review', '-pub_date'],
+                name='comment_review_date_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='comment_author_date_idx'
+            ),
+        )
 
     def __str__(self):
         return self.text
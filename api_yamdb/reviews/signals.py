@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review, Title
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def update_title_rating(sender, instance, **kwargs):
+    Title.recompute_rating((instance.title_id,))